@@ -1,7 +1,25 @@
 from collections import UserDict
-import re
-from datetime import datetime, timedelta
+import calendar
+from datetime import date, datetime
+import json
+import os
 import pickle
+import sys
+
+
+# Read/write buffer for the address book file
+_IO_BUFFER_SIZE = 1 << 20
+
+# Days in the year before the first of each month (non-leap), indexed by month
+_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+def _day_of_year(month, day, is_leap):
+    """
+    Returns the 1-based day of the year for the given month and day.
+    February 29th falls on March 1st in non-leap years.
+    """
+    return _DAYS_BEFORE_MONTH[month] + day + (is_leap and month > 2)
 
 
 class Field:
@@ -10,6 +28,8 @@ class Field:
     Stores a single value and provides string representation.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -23,6 +43,8 @@ class Name(Field):
     The name field is required and cannot be empty.
     """
 
+    __slots__ = ()
+
     def __init__(self, value):
         if not value:
             raise ValueError("Name can't be empty")
@@ -35,8 +57,10 @@ class Phone(Field):
     Validates that the phone number consists of exactly 10 digits.
     """
 
+    __slots__ = ()
+
     def __init__(self, phone):
-        if not re.fullmatch(r"\d{10}", phone):
+        if len(phone) != 10 or not phone.isdecimal():
             raise ValueError("The phone should contain 10 digits")
         super().__init__(phone)
 
@@ -47,12 +71,26 @@ class Birthday(Field):
     Validates that the date is in DD.MM.YYYY format.
     """
 
+    __slots__ = ("month", "day", "formatted")
+
     def __init__(self, value):
+        # Fixed-width format, parsed by hand to avoid strptime's overhead
+        if (
+            len(value) != 10
+            or value[2] != "."
+            or value[5] != "."
+            or not (value[:2] + value[3:5] + value[6:]).isdecimal()
+        ):
+            raise ValueError("Invalid date format. Use DD.MM.YYYY")
+        day, month, year = int(value[:2]), int(value[3:5]), int(value[6:])
         try:
-            date_value = datetime.strptime(value, "%d.%m.%Y")
+            date_value = datetime(year, month, day)
         except ValueError:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
         super().__init__(date_value)
+        self.month = month
+        self.day = day
+        self.formatted = f"{day:02d}.{month:02d}.{year:04d}"
 
 
 class Record:
@@ -62,42 +100,104 @@ class Record:
     Provides methods to add, edit, remove phone numbers and add birthday.
     """
 
+    __slots__ = (
+        "name",
+        "phones",
+        "birthday",
+        "_phone_index",
+        "_phones_str_cache",
+        "_display_line_cache",
+        "_book",
+    )
+
     def __init__(self, name):
         self.name = Name(name)
         self.phones = []
         self.birthday = None
+        self._phone_index = set()
+        self._invalidate_caches()
+        # Set by AddressBook.add_record so phone changes reach its index
+        self._book = None
+
+    @classmethod
+    def _from_saved(cls, name, phones, birthday):
+        """
+        Rebuilds a record from the fields written by save_data.
+        Phones were validated before saving, so Phone is skipped here.
+        """
+        record = cls(name)
+        record.phones = list(phones)
+        record._phone_index = set(record.phones)
+        if birthday is not None:
+            record.add_birthday(birthday)
+        return record
+
+    def _invalidate_caches(self):
+        self._phones_str_cache = None
+        self._display_line_cache = None
+
+    def _mark_changed(self):
+        self._invalidate_caches()
+        if self._book is not None:
+            self._book._dirty = True
 
     def add_phone(self, phone):
-        new_phone = Phone(phone)
-        self.phones.append(new_phone)
+        # Phone only validates; the record keeps the bare string
+        Phone(phone)
+        self.phones.append(phone)
+        self._phone_index.add(phone)
+        self._mark_changed()
+        if self._book is not None:
+            self._book._index_phone(phone, self)
 
     def remove_phone(self, phone):
-        current_phone = self.find_phone(phone)
-        if current_phone is None:
+        if self.find_phone(phone) is None:
             raise ValueError("Phone not found")
-        self.phones.remove(current_phone)
+        self.phones.remove(phone)
+        self._reindex_phone(phone)
+        self._mark_changed()
 
     def edit_phone(self, old_phone, new_phone):
-        current_phone = self.find_phone(old_phone)
-        if current_phone is None:
+        if self.find_phone(old_phone) is None:
             raise ValueError("Phone not found")
-        validated_phone = Phone(new_phone)
-        current_phone.value = validated_phone.value
+        Phone(new_phone)
+        self.phones[self.phones.index(old_phone)] = new_phone
+        self._reindex_phone(old_phone)
+        self._phone_index.add(new_phone)
+        self._mark_changed()
+        if self._book is not None:
+            self._book._index_phone(new_phone, self)
 
     def find_phone(self, phone):
-        for phone_obj in self.phones:
-            if phone_obj.value == phone:
-                return phone_obj
-        return None
+        return phone if phone in self._phone_index else None
+
+    def _reindex_phone(self, phone):
+        # The same number may be stored more than once
+        if phone not in self.phones:
+            self._phone_index.discard(phone)
+            if self._book is not None:
+                self._book._unindex_phone(phone, self)
+
+    def phones_str(self):
+        if self._phones_str_cache is None:
+            self._phones_str_cache = "; ".join(self.phones)
+        return self._phones_str_cache
+
+    def display_line(self):
+        if self._display_line_cache is None:
+            birthday = self.birthday.formatted if self.birthday else "No birthday"
+            self._display_line_cache = (
+                f"{self.name.value}: {self.phones_str()}; Birthday: {birthday}"
+            )
+        return self._display_line_cache
 
     def add_birthday(self, birthday_string):
         self.birthday = Birthday(birthday_string)
+        self._mark_changed()
 
     def __str__(self):
-        phones_str = "; ".join(p.value for p in self.phones)
-        birthday_str = (
-            self.birthday.value.strftime("%d.%m.%Y") if self.birthday else "No birthday"
-        )
+        phones_str = self.phones_str()
+        birthday_str = self.birthday.formatted if self.birthday else "No birthday"
         return f"Contact name: {self.name.value}, phones: {phones_str}, birthday: {birthday_str}"
 
     def __repr__(self):
@@ -110,21 +210,67 @@ class AddressBook(UserDict):
     Provides methods to add, find, delete records and get upcoming birthdays.
     """
 
+    def __init__(self, *args, **kwargs):
+        # Phone number -> records holding it, as an insertion-ordered dict
+        self._phone_to_records = {}
+        # Whether the book changed since it was loaded or saved
+        self._dirty = False
+        super().__init__(*args, **kwargs)
+
     def add_record(self, record):
-        self.data[record.name.value] = record
+        # Interned names let dict lookups match on identity first
+        name = sys.intern(record.name.value)
+        record.name.value = name
+        previous = self.data.get(name)
+        if previous is not None and previous is not record:
+            self._detach(previous)
+        self.data[name] = record
+        record._book = self
+        for phone in record.phones:
+            self._index_phone(phone, record)
+        self._dirty = True
 
     def find(self, name):
         return self.data.get(name)
 
+    def find_by_phone(self, phone):
+        records = self._phone_to_records.get(phone)
+        return next(iter(records)) if records else None
+
     def delete(self, name):
         record = self.find(name)
         if record is None:
             raise KeyError("Record not found")
         del self.data[name]
+        self._detach(record)
+        self._dirty = True
+
+    def _detach(self, record):
+        for phone in record.phones:
+            self._unindex_phone(phone, record)
+        record._book = None
+
+    def _index_phone(self, phone, record):
+        self._phone_to_records.setdefault(phone, {})[record] = None
+
+    def _unindex_phone(self, phone, record):
+        records = self._phone_to_records.get(phone)
+        if records is None:
+            return
+        records.pop(record, None)
+        if not records:
+            del self._phone_to_records[phone]
 
     def get_upcoming_birthdays(self):
         today_date = datetime.today().date()
         current_year = today_date.year
+        today_ordinal = today_date.toordinal()
+        today_weekday = today_date.weekday()
+        # Ordinal of the day before January 1st, for this and next year
+        this_year_base = date(current_year, 1, 1).toordinal() - 1
+        next_year_base = date(current_year + 1, 1, 1).toordinal() - 1
+        this_year_leap = calendar.isleap(current_year)
+        next_year_leap = calendar.isleap(current_year + 1)
         result = []
 
         for record in self.data.values():
@@ -132,24 +278,23 @@ class AddressBook(UserDict):
             if contact_birthday is None:
                 continue
 
-            birthday_date = contact_birthday.value.date()
-            current_year_birthday_date = birthday_date.replace(year=current_year)
+            month, day = contact_birthday.month, contact_birthday.day
+            birthday_ordinal = this_year_base + _day_of_year(month, day, this_year_leap)
 
-            if current_year_birthday_date < today_date:
-                current_year_birthday_date = current_year_birthday_date.replace(
-                    year=current_year + 1
+            if birthday_ordinal < today_ordinal:
+                birthday_ordinal = next_year_base + _day_of_year(
+                    month, day, next_year_leap
                 )
 
-            days_diff = (current_year_birthday_date - today_date).days
+            days_diff = birthday_ordinal - today_ordinal
 
             if 0 <= days_diff <= 7:
-                congratulation_date = current_year_birthday_date
-                # If birthday falls on Saturday, move to next Monday
-                if congratulation_date.weekday() == 5:
-                    congratulation_date += timedelta(days=2)
-                # If birthday falls on Sunday, move to next Monday
-                elif congratulation_date.weekday() == 6:
-                    congratulation_date += timedelta(days=1)
+                # Weekday follows from today's, no need to ask each date
+                weekday = (today_weekday + days_diff) % 7
+                # If birthday falls on a weekend, move to next Monday
+                if weekday >= 5:
+                    birthday_ordinal += 7 - weekday
+                congratulation_date = date.fromordinal(birthday_ordinal)
 
                 formatted_congratulation_date = congratulation_date.strftime("%d.%m.%Y")
 
@@ -169,13 +314,11 @@ class AddressBook(UserDict):
 def input_error(func):
     """
     Decorator for handling input errors and displaying informative messages.
-    Now also handles AttributeError for missing contacts.
+    Missing contacts are checked by the handlers themselves.
     """
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except AttributeError:
-            return "Error: Contact not found"
         except (KeyError, ValueError, IndexError) as e:
             return f"Error: {str(e)}"
     return wrapper
@@ -203,6 +346,8 @@ def change_contact(args, book: AddressBook):
         raise ValueError("Usage: change [name] [old_phone] [new_phone]")
     name, old_phone, new_phone, *_ = args
     record = book.find(name)
+    if record is None:
+        return "Error: Contact not found"
     record.edit_phone(old_phone, new_phone)
     return "Phone updated."
 
@@ -213,25 +358,18 @@ def show_phones(args, book: AddressBook):
         raise ValueError("Usage: phone [name]")
     name, *_ = args
     record = book.find(name)
+    if record is None:
+        return "Error: Contact not found"
     if not record.phones:
         return "No phones found."
-    return "; ".join([p.value for p in record.phones])
+    return record.phones_str()
 
 
 @input_error
 def show_all(_, book: AddressBook):
     if not book.data:
         return "No contacts in address book."
-    result = []
-    for record in book.data.values():
-        phones = "; ".join([p.value for p in record.phones])
-        birthday = (
-            record.birthday.value.strftime("%d.%m.%Y")
-            if record.birthday
-            else "No birthday"
-        )
-        result.append(f"{record.name.value}: {phones}; Birthday: {birthday}")
-    return "\n".join(result)
+    return "\n".join(record.display_line() for record in book.data.values())
 
 
 @input_error
@@ -240,6 +378,8 @@ def add_birthday(args, book: AddressBook):
         raise ValueError("Usage: add-birthday [name] [DD.MM.YYYY]")
     name, birthday, *_ = args
     record = book.find(name)
+    if record is None:
+        return "Error: Contact not found"
     record.add_birthday(birthday)
     return "Birthday added."
 
@@ -250,9 +390,11 @@ def show_birthday(args, book: AddressBook):
         raise ValueError("Usage: show-birthday [name]")
     name, *_ = args
     record = book.find(name)
+    if record is None:
+        return "Error: Contact not found"
     if not record.birthday:
         return "No birthday set."
-    return record.birthday.value.strftime("%d.%m.%Y")
+    return record.birthday.formatted
 
 
 @input_error
@@ -272,22 +414,111 @@ def parse_input(user_input):
     Parses the user's input command.
     Returns the command and a list of arguments.
     """
-    cmd, *args = user_input.split()
-    cmd = cmd.strip().lower()
-    return cmd, *args
+    # Commands take at most 3 arguments; anything past them stays unsplit
+    parts = user_input.split(None, 4)
+    cmd = parts[0].lower() if parts else ""
+    return cmd, *parts[1:]
+
+
+# Commands that only call a handler; close/exit/hello are handled in main
+_COMMANDS = {
+    "add": add_contact,
+    "change": change_contact,
+    "phone": show_phones,
+    "all": show_all,
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+    "birthdays": birthdays,
+}
+
+
+def save_data(book, filename="addressbook.json"):
+    data = {
+        name: {
+            "phones": record.phones,
+            "birthday": record.birthday.formatted if record.birthday else None,
+        }
+        for name, record in book.data.items()
+    }
+    # Write a temporary file and swap it in, so a crash never leaves a
+    # half-written address book behind
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, "w", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
+        json.dump(data, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_filename, filename)
+    book._dirty = False
+
+
+def load_data(filename="addressbook.json", legacy_filename="addressbook.pkl"):
+    """
+    Loads the address book saved by save_data.
+    Falls back to the old pickle file if no JSON file exists yet.
+    """
+    try:
+        with open(filename, "r", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return _load_legacy_data(legacy_filename)
+
+    book = AddressBook()
+    for name, fields in data.items():
+        book.add_record(
+            Record._from_saved(name, fields["phones"], fields["birthday"])
+        )
+    book._dirty = False
+    return book
+
+
+class _LegacyObject:
+    """
+    Stand-in for the classes stored in old pickle files.
+    Keeps whatever attributes were pickled, so nothing runs on load.
+    Takes both the __dict__ state of the original classes and the
+    (None, slots) state written once fields used __slots__.
+    """
 
 
-def save_data(book, filename="addressbook.pkl"):
-    with open(filename, "wb") as f:
-        pickle.dump(book, f)
+class _LegacyUnpickler(pickle.Unpickler):
+    """
+    Unpickler for the old addressbook.pkl format.
+    Maps the address book classes to _LegacyObject and refuses anything
+    else the file was never meant to contain.
+    """
+
+    _CLASSES = {"AddressBook", "Record", "Name", "Phone", "Birthday"}
 
+    def find_class(self, module, name):
+        # The bot runs as a script, so old files refer to __main__
+        if module in ("__main__", "main") and name in self._CLASSES:
+            return _LegacyObject
+        if module == "datetime" and name in ("datetime", "date"):
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f"Unexpected {module}.{name} in address book")
 
-def load_data(filename="addressbook.pkl"):
+
+def _load_legacy_data(filename="addressbook.pkl"):
     try:
-        with open(filename, "rb") as f:
-            return pickle.load(f)
+        with open(filename, "rb", buffering=_IO_BUFFER_SIZE) as f:
+            legacy_book = _LegacyUnpickler(f).load()
     except FileNotFoundError:
         return AddressBook()
+    # Rebuild every contact through the current classes; the book stays
+    # dirty, so the next exit writes it out as JSON
+    book = AddressBook()
+    for legacy_record in legacy_book.data.values():
+        record = Record(legacy_record.name.value)
+        for phone in legacy_record.phones:
+            # Files saved after phones became plain strings hold str here
+            record.add_phone(phone if isinstance(phone, str) else phone.value)
+        if legacy_record.birthday is not None:
+            birthday = legacy_record.birthday.value
+            record.add_birthday(
+                f"{birthday.day:02d}.{birthday.month:02d}.{birthday.year:04d}"
+            )
+        book.add_record(record)
+    return book
 
 
 def main():
@@ -295,7 +526,8 @@ def main():
     Main loop of the assistant bot.
     Accepts commands and calls the corresponding handler functions.
     """
-    book = load_data()
+    # Loaded on the first command that needs it
+    book = None
     print("Welcome to the assistant bot!")
     while True:
         user_input = input("Enter a command: ")
@@ -303,36 +535,22 @@ def main():
 
         match command:
             case "close" | "exit":
-                save_data(book)
+                if book is not None and book._dirty:
+                    save_data(book)
                 print("Good bye!")
                 break
 
             case "hello":
                 print("How can I help you?")
 
-            case "add":
-                print(add_contact(args, book))
-
-            case "change":
-                print(change_contact(args, book))
-
-            case "phone":
-                print(show_phones(args, book))
-
-            case "all":
-                print(show_all(args, book))
-
-            case "add-birthday":
-                print(add_birthday(args, book))
-
-            case "show-birthday":
-                print(show_birthday(args, book))
-
-            case "birthdays":
-                print(birthdays(args, book))
-
             case _:
-                print("Invalid command.")
+                handler = _COMMANDS.get(command)
+                if handler is None:
+                    print("Invalid command.")
+                else:
+                    if book is None:
+                        book = load_data()
+                    sys.stdout.write(handler(args, book) + "\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+import collections
+import os
+import pickle
+import unittest
+
+import main
+
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), "test_data")
+
+
+class LegacyDataTest(unittest.TestCase):
+    """
+    Loading address books pickled by earlier versions of the bot.
+    """
+
+    def load(self, filename):
+        return main.load_data(
+            os.path.join(TEST_DATA, "missing.json"),
+            os.path.join(TEST_DATA, filename),
+        )
+
+    def assert_migrated(self, book):
+        self.assertEqual(list(book.data), ["Alice", "Bob"])
+        alice = book.find("Alice")
+        self.assertEqual(alice.phones, ["1234567890", "0987654321"])
+        self.assertEqual(alice.birthday.formatted, "15.03.1990")
+        self.assertEqual(
+            alice.display_line(),
+            "Alice: 1234567890; 0987654321; Birthday: 15.03.1990",
+        )
+        self.assertIs(book.find_by_phone("1112223333"), book.find("Bob"))
+        self.assertIsNone(book.find("Bob").birthday)
+        self.assertTrue(book._dirty)
+        book.get_upcoming_birthdays()
+
+    def test_load_baseline_pickle(self):
+        self.assert_migrated(self.load("addressbook_baseline.pkl"))
+
+    def test_load_pickle_with_slotted_fields(self):
+        self.assert_migrated(self.load("addressbook_slots.pkl"))
+
+    def test_load_pickle_with_string_phones(self):
+        self.assert_migrated(self.load("addressbook_str_phones.pkl"))
+
+    def test_migrated_book_saves_as_json(self):
+        book = self.load("addressbook_baseline.pkl")
+        filename = os.path.join(TEST_DATA, "migrated.json")
+        try:
+            main.save_data(book, filename)
+            saved = main.load_data(filename)
+        finally:
+            os.remove(filename)
+        alice = saved.find("Alice")
+        self.assertEqual(alice.phones_str(), "1234567890; 0987654321")
+        self.assertEqual(alice.find_phone("0987654321"), "0987654321")
+        self.assertEqual(alice.birthday.formatted, "15.03.1990")
+        self.assertIs(saved.find_by_phone("1112223333"), saved.find("Bob"))
+        self.assertFalse(saved._dirty)
+
+    def test_unexpected_class_is_rejected(self):
+        filename = os.path.join(TEST_DATA, "unexpected.pkl")
+        with open(filename, "wb") as f:
+            pickle.dump(collections.OrderedDict(), f)
+        try:
+            with self.assertRaises(pickle.UnpicklingError):
+                self.load("unexpected.pkl")
+        finally:
+            os.remove(filename)
+
+    def test_missing_legacy_file_gives_empty_book(self):
+        self.assertEqual(len(self.load("missing.pkl")), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()